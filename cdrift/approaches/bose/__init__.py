@@ -3,6 +3,7 @@ from cdrift.approaches.bose.bose import \
     extractRelationEntropy, \
     extractWindowCount, \
     extractJMeasure, \
+    extractJMeasureAndWindowCount, \
     KSTest_2Sample_SlidingWindow, \
     MannWhitney_U_SlidingWindow, \
     detectChange_JMeasure_KS, \
@@ -16,4 +17,6 @@ from cdrift.approaches.bose.bose import \
     detectChange_JMeasure_KS_Step, \
     detectChange_JMeasure_MU_Step, \
     detectChange_WC_KS_Step, \
-    detectChange_WC_MU_Step
\ No newline at end of file
+    detectChange_WC_MU_Step, \
+    detectChange_Both_KS_Step, \
+    detectChange_Both_MU_Step
\ No newline at end of file
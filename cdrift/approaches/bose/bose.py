@@ -222,8 +222,24 @@ def extractJMeasure(log:EventLog, act1:str, act2:str, windowsize:int=None, activ
         np.ndarray: The J-Measure Time-Series (A 1x|log| signal of J-Measures)
     """
 
-    output = np.empty(len(log))
     sf = _calculateSF(log, act1, act2, windowsize, activityName_key=activityName_key)
+    return _jMeasureFromSF(log, sf, act1, act2, activityName_key=activityName_key)
+
+def _jMeasureFromSF(log:EventLog, sf:List[Tuple[List[str],List[str]]], act1:str, act2:str, activityName_key:str=xes.DEFAULT_NAME_KEY)->np.ndarray:
+    """Helper function to compute the J-Measure series from already computed S and F Sets.
+
+    Args:
+        log (EventLog): The log for which to extract the J-Measure
+        sf (List[Tuple[List[str],List[str]]]): The S and F Sets of each trace, as computed by `_calculateSF`
+        act1 (str): The name of the first activity of the pair
+        act2 (str): The name of the second activity of the pair
+        activityName_key (str, optional): The key for the activity value in the event log. Defaults to xes.DEFAULT_NAME_KEY.
+
+    Returns:
+        np.ndarray: The J-Measure Time-Series (A 1x|log| signal of J-Measures)
+    """
+
+    output = np.empty(len(log))
     for i, trace in enumerate(log):
         S, F = sf[i]
         #Avoiding Division by Zero here by setting p_ab to 0. 
@@ -239,6 +255,23 @@ def extractJMeasure(log:EventLog, act1:str, act2:str, windowsize:int=None, activ
         output[i]=p_a * ct
     return output
 
+def extractJMeasureAndWindowCount(log:EventLog, act1:str, act2:str, windowsize:int=None, activityName_key:str=xes.DEFAULT_NAME_KEY)->Tuple[np.ndarray, List[int]]:
+    """Extracts both the J-Measure and the Window Count series for a pair of activities. Both measures are based on the same S and F Sets, so these are only computed once.
+
+    Args:
+        log (EventLog): The log for which to extract the measures
+        act1 (str): The name of the first activity, we consider how often, in a trace, after act1 act2 will follow
+        act2 (str): The name of the second activity, for which we consider how often it eventually follows act1
+        windowsize (int, optional): The window, how far we check for an eventually-follows relation of act1 and act2, if None, this will be set to the average trace length of the log. Defaults to None.
+        activityName_key (str, optional): The key for the activity value in the event log. Defaults to xes.DEFAULT_NAME_KEY.
+
+    Returns:
+        Tuple[np.ndarray, List[int]]: The J-Measure series and the Window Count series, as returned by `extractJMeasure` and `extractWindowCount`
+    """
+
+    sf = _calculateSF(log, act1, act2, windowsize, activityName_key=activityName_key)
+    return _jMeasureFromSF(log, sf, act1, act2, activityName_key=activityName_key), [len(f) for s,f in sf]
+
 def KSTest_2Sample_SlidingWindow(signal:np.ndarray, windowSize:int)->np.ndarray:
     """Applies the Two-Sample Kolmogorov-Smirnov Test to the given Signal.
 
@@ -535,6 +568,55 @@ def _detectChangeLocal_Step(log:EventLog, stattest:str, measure:str, windowSize:
         progress.close()
     return pvals
 
+def _detectChangeLocal_Both_Step(log:EventLog, stattest:str, windowSize:int, measure_window:int=None, step_size:int=1, activityName_key:str=xes.DEFAULT_NAME_KEY, show_progress_bar:bool=True, progressBarPos:int=None)->Tuple[np.ndarray, np.ndarray]:
+    """A helper function to apply statistical testing using both local measures (J and Window Count) in a single pass over the activity pairs. Both measures are extracted from the same S and F Sets.
+
+    Args:
+        log (EventLog): The log on which to apply the concept drift detection.
+        stattest (str): The statistical test to employ on the extracted measures.
+        windowSize (int): The window size to use for sliding window statistical testing.
+        measure_window (int, optional): The window size to use for the measure extraction. Defaults to None.
+        step_size (int, optional): The step size to use for sliding the windows. Defaults to 1.
+        activityName_key (str, optional): The key for the activity value in the event log. Defaults to xes.DEFAULT_NAME_KEY.
+        show_progress_bar (bool, optional): Configures whether or not to show a progress bar. Defaults to True.
+        progressBarPos (int, optional): The `pos` parameter for tqdm progress bars. The "line" in which to show the bar. Defaults to None.
+
+    Raises:
+        ValueError: if the string supplied as `stattest` is invalid.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The computed p-values of the J-Measure, and of the Window Count.
+    """
+
+    if stattest in ["ks", "KS"]:
+        test = KSTest_2Sample_SlidingWindow_Step
+    elif stattest in ["u", "U", "mu", "MU"]:
+        test = MannWhitney_U_SlidingWindow_Step
+    else:
+        raise ValueError("Invalid statistical test argument.")
+
+    activities = _getActivityNames(log,activityName_key)
+    pvals_j = None
+    pvals_wc = None
+    progress = None
+    if show_progress_bar:
+        progress = makeProgressBar(num_iters=len(activities)**2, message="Calculating J and WC P-Values for Bose, activity pairs complete", position=progressBarPos)
+    for act1 in activities:
+        for act2 in activities:
+            j, wc = extractJMeasureAndWindowCount(log, act1, act2, measure_window, activityName_key)
+            pvals_j_ = test(j, windowSize, step_size)
+            pvals_wc_ = test(wc, windowSize, step_size)
+            # Add new pvals for mean calculation later
+            pvals_j = pvals_j + pvals_j_ if pvals_j is not None else pvals_j_
+            pvals_wc = pvals_wc + pvals_wc_ if pvals_wc is not None else pvals_wc_
+            if progress is not None:
+                progress.update()
+    pvals_j = pvals_j / pow(len(activities),2)
+    pvals_wc = pvals_wc / pow(len(activities),2)
+    if progress is not None:
+        progress.close()
+    return pvals_j, pvals_wc
+
 def KSTest_2Sample_SlidingWindow_Step(signal:np.ndarray, windowSize:int, step_size:int=1)->np.ndarray:
     """Applies the Two-Sample Kolmogorov-Smirnov Test to the given Signal.
 
@@ -669,3 +751,40 @@ def detectChange_WC_MU_Step(log:EventLog, windowSize:int, measure_window:int=Non
     """
     
     return _detectChangeLocal_Step(log, "MU", "WC", windowSize, measure_window, step_size, activityName_key, show_progress_bar, progressBarPos)
+
+
+def detectChange_Both_KS_Step(log:EventLog, windowSize:int, measure_window:int=None, step_size:int=1, activityName_key:str=xes.DEFAULT_NAME_KEY, show_progress_bar:bool=True, progressBarPos:int=None)->Tuple[np.ndarray, np.ndarray]:
+    """Apply Concept Drift Detection using both the J-Measure and the Window Count with a Kolmogorov-Smirnov Test. Equivalent to calling `detectChange_JMeasure_KS_Step` and `detectChange_WC_KS_Step`, but the measures are extracted in a single pass.
+
+    Args:
+        log (EventLog): The log on which to apply the concept drift detection.
+        windowSize (int): The window size to use for sliding window statistical testing.
+        measure_window (int, optional): The window size to use for the measure extraction. If `None`, defaults to average trace length in the log. Defaults to None.
+        step_size (int, optional): The step size to use for sliding the windows. Defaults to 1.
+        activityName_key (str, optional): The key for the activity value in the event log. Defaults to xes.DEFAULT_NAME_KEY.
+        show_progress_bar (bool, optional): Configures whether or not to show a progress bar. Defaults to True.
+        progressBarPos (int, optional): The `pos` parameter for tqdm progress bars. The "line" in which to show the bar. Defaults to None.
+
+    Returns:
+         Tuple[np.ndarray, np.ndarray]: The computed p-values of the J-Measure, and of the Window Count. Dimensions 1x|log| each
+    """
+
+    return _detectChangeLocal_Both_Step(log, "KS", windowSize, measure_window, step_size, activityName_key, show_progress_bar, progressBarPos)
+
+def detectChange_Both_MU_Step(log:EventLog, windowSize:int, measure_window:int=None, step_size:int=1, activityName_key:str=xes.DEFAULT_NAME_KEY, show_progress_bar:bool=True, progressBarPos:int=None)->Tuple[np.ndarray, np.ndarray]:
+    """Apply Concept Drift Detection using both the J-Measure and the Window Count with a Mann-Whitney U-Test. Equivalent to calling `detectChange_JMeasure_MU_Step` and `detectChange_WC_MU_Step`, but the measures are extracted in a single pass.
+
+    Args:
+        log (EventLog): The log on which to apply the concept drift detection.
+        windowSize (int): The window size to use for sliding window statistical testing.
+        measure_window (int, optional): The window size to use for the measure extraction. If `None`, defaults to average trace length in the log. Defaults to None.
+        step_size (int, optional): The step size to use for sliding the windows. Defaults to 1.
+        activityName_key (str, optional): The key for the activity value in the event log. Defaults to xes.DEFAULT_NAME_KEY.
+        show_progress_bar (bool, optional): Configures whether or not to show a progress bar. Defaults to True.
+        progressBarPos (int, optional): The `pos` parameter for tqdm progress bars. The "line" in which to show the bar. Defaults to None.
+
+    Returns:
+         Tuple[np.ndarray, np.ndarray]: The computed p-values of the J-Measure, and of the Window Count. Dimensions 1x|log| each
+    """
+
+    return _detectChangeLocal_Both_Step(log, "MU", windowSize, measure_window, step_size, activityName_key, show_progress_bar, progressBarPos)
@@ -4,4 +4,7 @@ from cdrift.approaches.earthmover.earthmover import \
     calculateDistSeriesStride,\
     visualInspection,\
     visualInspection_Stride,\
-    detect_change
\ No newline at end of file
+    detect_change,\
+    extractTraceVariants,\
+    calculateDistSeriesStride_Batched,\
+    detect_change_batched
\ No newline at end of file
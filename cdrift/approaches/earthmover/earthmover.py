@@ -236,14 +236,38 @@ def calcEMD(dist1:List[Tuple[Iterable[str], float]], dist2: List[Tuple[Iterable[
                 previous_distances[(trace1,trace2)] = postNormalizedLevenshteinDistance(trace1,trace2)
             distances[i,j] = previous_distances[(trace1,trace2)]
     
-    solver = EMD()
-    distance = solver(
-        [freq for _,freq in dist1],
-        [freq for _,freq in dist2],
-        distances
-    )
+    distance = _closedFormEMD([freq for _,freq in dist1], [freq for _,freq in dist2], distances)
+    if distance is None:
+        solver = EMD()
+        distance = solver(
+            [freq for _,freq in dist1],
+            [freq for _,freq in dist2],
+            distances
+        )
     return distance if not return_distances else (distance, previous_distances)
 
+def _closedFormEMD(freqs1:List[float], freqs2:List[float], distances:np.ndarray)->float:
+    """Calculate the Earth-Mover's Distance in closed form, for the cases where the optimal transport plan is known without solving the transport problem:
+
+    - If one population consists of a single trace, all mass has to be moved from/to this trace, so the EMD is the frequency-weighted sum of distances to this trace.
+    - If both populations are identical, nothing has to be moved, so the EMD is 0 (the distance between two different traces is always positive).
+
+    Args:
+        freqs1 (List[float]): The probabilities of the traces of the first population.
+        freqs2 (List[float]): The probabilities of the traces of the second population.
+        distances (np.ndarray): The distances between the traces of the first and the second population.
+
+    Returns:
+        float: The Earth-Mover's Distance, or None if neither case applies.
+    """
+    if len(freqs1) == 1:
+        return float(np.dot(freqs2, distances[0,:]))
+    elif len(freqs2) == 1:
+        return float(np.dot(freqs1, distances[:,0]))
+    elif freqs1 == freqs2 and len(freqs1) == distances.shape[0] == distances.shape[1] and not np.diagonal(distances).any():
+        return 0.0
+    return None
+
 #f1 = [(('a','b','d','f'),.5), (('a','c','f'),.4),(('a','b','e','f'),.1)]
 #f2 = [(('a','b','d','f'),.5), (('a','c','f'),.35), (('a','b','d','e','f'),.15)]
 #f3 = [(('a','b','d','f'),.2), (('a','c','f'),.7),(('a','b','e','f'),.1)]
@@ -397,4 +421,98 @@ def visualInspection_Stride(signal, window_size:int, step_size:int=1):
 def detect_change(log:EventLog, window_size:int, stride:int=1, activityName_key:str=xes.DEFAULT_NAME_KEY, show_progress_bar:bool=True, progress_bar_pos:int=None):
     traces = extractTraces(log, activityName_key=activityName_key)
     dists = calculateDistSeriesStride(traces,window_size,stride,show_progress_bar,progress_bar_pos)
-    return visualInspection_Stride(dists, window_size, stride)
\ No newline at end of file
+    return visualInspection_Stride(dists, window_size, stride)
+
+def extractTraceVariants(log:EventLog, activityName_key:str=xes.DEFAULT_NAME_KEY)->Tuple[np.ndarray, List[Tuple[str]]]:
+    """Extract the traces from the event log as integer ids of their variant, i.e., of their sequence of executed activities.
+
+    Args:
+        log (EventLog): The event log
+        activityName_key (str, optional): The key for the activity value in the event log. Defaults to xes.DEFAULT_NAME_KEY.
+
+    Returns:
+        Tuple[np.ndarray, List[Tuple[str]]]: Tuple of: (the variant id of each case (in order), the variants as tuples of executed activities, indexed by their id)
+    """
+    variant_ids = {}
+    ids = np.fromiter(
+        (variant_ids.setdefault(trace, len(variant_ids)) for trace in extractTraces(log, activityName_key=activityName_key)),
+        dtype=np.int64, count=len(log)
+    )
+    return ids, list(variant_ids.keys())
+
+def _variantPopulation(window:np.ndarray)->Tuple[List[int], List[float]]:
+    """
+        Converts a window of variant ids to its stochastic language; variants in order of first occurrence, like `Counter` in `calculateDistSeriesStride`
+    """
+    variants, first_index, counts = np.unique(window, return_index=True, return_counts=True)
+    order = np.argsort(first_index)
+    return variants[order].tolist(), (counts[order] / len(window)).tolist()
+
+def calculateDistSeriesStride_Batched(variant_ids:np.ndarray, variants:List[Tuple[str]], window_sizes:List[int], stride:int=1, show_progressBar:bool=True, progressBar_pos:int=None)->Dict[int, List[float]]:
+    """Calculate the series of Earth Mover's Distances for multiple window sizes at once. Equivalent to calling `calculateDistSeriesStride` for each window size, but the distances between variants are computed only once for all window sizes.
+
+    Args:
+        variant_ids (np.ndarray): The variant id of each case, extracted using extractTraceVariants
+        variants (List[Tuple[str]]): The variants, indexed by their id, extracted using extractTraceVariants
+        window_sizes (List[int]): The window sizes to use for the sliding-window application of Earth Mover's Distance Calculations
+        stride (int, optional): The step size of the sliding window. Defaults to 1.
+        show_progressBar (bool, optional): Configures whether or not to show a progress bar. Defaults to True.
+        progressBar_pos (int, optional): The argument `pos` for tqdm progress bars. In which line to print the progress bar. Defaults to None.
+
+    Returns:
+        Dict[int, List[float]]: The computed sequence of Earth Mover's Distances for each window size.
+    """
+    if show_progressBar:
+        progress = makeProgressBar(sum(max(0, len(variant_ids)-(2*window_size)) for window_size in window_sizes), "calculating earthmover values, completed windows", position=progressBar_pos)
+
+    solver = EMD()
+    distances = {} # Shared by all window sizes
+    dist_series = {}
+    for window_size in window_sizes:
+        dists = []
+        for i in range(0, len(variant_ids) - (2*window_size), stride):
+            variants1, freqs1 = _variantPopulation(variant_ids[i:i+window_size])
+            variants2, freqs2 = _variantPopulation(variant_ids[i+window_size:i+(2*window_size)])
+            if variants1 == variants2 and freqs1 == freqs2:
+                # Identical populations, nothing has to be moved
+                dists.append(0.0)
+                if show_progressBar:
+                    progress.update(n=min(len(variant_ids)-(2*window_size)-i, stride))
+                continue
+            ground_distances = np.empty((len(variants1), len(variants2)))
+            for a, variant1 in enumerate(variants1):
+                for b, variant2 in enumerate(variants2):
+                    distance = distances.get((variant1, variant2), None)
+                    if distance is None:
+                        distance = postNormalizedLevenshteinDistance(variants[variant1], variants[variant2])
+                        distances[(variant1, variant2)] = distance
+                    ground_distances[a,b] = distance
+            emd = _closedFormEMD(freqs1, freqs2, ground_distances)
+            dists.append(emd if emd is not None else solver(freqs1, freqs2, ground_distances))
+            if show_progressBar:
+                progress.update(n=min(len(variant_ids)-(2*window_size)-i, stride))
+        dist_series[window_size] = dists
+    if show_progressBar:
+        progress.close()
+    return dist_series
+
+def detect_change_batched(log:EventLog, window_sizes:List[int], stride:int=1, activityName_key:str=xes.DEFAULT_NAME_KEY, show_progress_bar:bool=True, progress_bar_pos:int=None)->Dict[int, List[int]]:
+    """Detect change points with the Earth Mover's Distance for multiple window sizes at once. Equivalent to calling `detect_change` for each window size, but the traces are only extracted once, and the distances between variants are shared by all window sizes.
+
+    Args:
+        log (EventLog): The event log
+        window_sizes (List[int]): The window sizes to use.
+        stride (int, optional): The step size of the sliding window. Defaults to 1.
+        activityName_key (str, optional): The key for the activity value in the event log. Defaults to xes.DEFAULT_NAME_KEY.
+        show_progress_bar (bool, optional): Configures whether or not to show a progress bar. Defaults to True.
+        progress_bar_pos (int, optional): The argument `pos` for tqdm progress bars. In which line to print the progress bar. Defaults to None.
+
+    Returns:
+        Dict[int, List[int]]: The detected change points for each window size.
+    """
+    variant_ids, variants = extractTraceVariants(log, activityName_key=activityName_key)
+    dist_series = calculateDistSeriesStride_Batched(variant_ids, variants, window_sizes, stride, show_progress_bar, progress_bar_pos)
+    return {
+        window_size: visualInspection_Stride(dists, window_size, stride)
+        for window_size, dists in dist_series.items()
+    }
@@ -3,7 +3,9 @@ from cdrift.approaches.martjushev.martjushev import \
     detectChange_JMeasure_MU,\
     detectChange_WindowCount_KS,\
     detectChange_WindowCount_MU, \
+    detectChange_Both_KS,\
     detectChange_ADWIN_JMeasure_KS,\
     detectChange_ADWIN_JMeasure_MU,\
     detectChange_ADWIN_WindowCount_KS,\
-    detectChange_ADWIN_WindowCount_MU
\ No newline at end of file
+    detectChange_ADWIN_WindowCount_MU,\
+    detectChange_ADWIN_Both_KS
\ No newline at end of file
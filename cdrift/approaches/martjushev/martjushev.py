@@ -1,4 +1,4 @@
-from cdrift.approaches.bose import extractJMeasure, extractWindowCount
+from cdrift.approaches.bose import extractJMeasure, extractWindowCount, extractJMeasureAndWindowCount
 from cdrift.utils.helpers import _getActivityNames, makeProgressBar, safe_update_bar
 
 import numpy as np
@@ -321,6 +321,42 @@ def _extractAllWindowCounts(log:EventLog, measure_window:int=None, activityName_
         progress.close()
     return signals
 
+def _extractAllJMeasuresAndWindowCounts(log:EventLog, measure_window:int=None, activityName_key:str=xes.DEFAULT_NAME_KEY, show_progress_bar:bool=True, progressBarPos:int=None)->Tuple[np.ndarray, np.ndarray]:
+    """A helper function used to compute both the J Measure and the Window Count over all pairs of activities in a single pass.
+
+    Args:
+        log (EventLog): The event log.
+        measure_window (int, optional): The window size to use for the measure extraction. If None, the average trace length is used. Defaults to None.
+        activityName_key (str, optional): The key for the activity value in the event log. Defaults to xes.DEFAULT_NAME_KEY.
+        show_progress_bar (bool, optional): Configures whether a progress bar should be shown. Defaults to True.
+        progressBarPos (int, optional): The `pos` argument for tqdm progress bars. In which line to print the progress bar. Defaults to None.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The extracted J-Measure values and Window Count values. Dimensions: num_activities x len(log) each
+    """
+
+    activities = _getActivityNames(log, activityName_key)
+    if show_progress_bar:
+        progress=makeProgressBar(num_iters=len(activities)**2, message="Extracting J and WC for Martjushev", position=progressBarPos)
+    else:
+        progress=None
+    signals_j = np.empty(
+        (len(activities)**2, len(log))
+    )
+    signals_wc = np.empty(
+        (len(activities)**2, len(log))
+    )
+    i = 0
+    for act1 in activities:
+        for act2 in activities:
+            signals_j[i], signals_wc[i] = extractJMeasureAndWindowCount(log, act1, act2, measure_window, activityName_key)
+            if progress is not None:
+                progress.update()
+            i += 1
+    if progress is not None:
+        progress.close()
+    return signals_j, signals_wc
+
 def detectChange_JMeasure_KS(log:EventLog, windowSize:int, pvalue:float, return_pvalues:bool=False, measure_window:int=None, activityName_key:str=xes.DEFAULT_NAME_KEY, show_progress_bar:bool=True, progressBarPos:int=None)->Union[List[int], Tuple[List[int], np.ndarray]]:
     """Apply Concept Drift Detection using the J-Measure and the Kolmogorov-Smirnov test.
 
@@ -361,6 +397,29 @@ def detectChange_WindowCount_KS(log:EventLog, windowSize:int, pvalue:float, retu
     signals = _extractAllWindowCounts(log,measure_window,activityName_key, show_progress_bar=show_progress_bar, progressBarPos=progressBarPos)
     return detectChange_AvgSeries(signals, windowSize, pvalue, stats.ks_2samp, return_pvalues, show_progress_bar=show_progress_bar, progressBarPos=progressBarPos)
 
+def detectChange_Both_KS(log:EventLog, windowSize:int, pvalue:float, return_pvalues:bool=False, measure_window:int=None, activityName_key:str=xes.DEFAULT_NAME_KEY, show_progress_bar:bool=True, progressBarPos:int=None)->Tuple[Union[List[int], Tuple[List[int], np.ndarray]], Union[List[int], Tuple[List[int], np.ndarray]]]:
+    """Apply Concept Drift Detection using both the J-Measure and the Window Count with the Kolmogorov-Smirnov test. Equivalent to calling `detectChange_JMeasure_KS` and `detectChange_WindowCount_KS`, but the measures are extracted in a single pass.
+
+    Args:
+        log (EventLog): The log on which to apply the concept drift detection.
+        windowSize (int): The window size to use for sliding window statistical testing.
+        pvalue (float): The p-value threshold for statistical testing. If the p-value of the statistical test is below this threshold, a changepoint is detected.
+        return_pvalues (bool, optional): If True, the p-values of the statistical tests are returned. Defaults to False.
+        measure_window (int, optional): The window size to use for the measure extraction. If `None`, defaults to average trace length in the log. Defaults to None.
+        activityName_key (str, optional): The key for the activity value in the event log. Defaults to xes.DEFAULT_NAME_KEY.
+        show_progress_bar (bool, optional): Configures whether or not to show a progress bar. Defaults to True.
+        progressBarPos (int, optional): The `pos` parameter for tqdm progress bars. The "line" in which to show the bar. Defaults to None.
+
+    Returns:
+        Tuple: The results for the J-Measure and for the Window Count, each as returned by `detectChange_JMeasure_KS` and `detectChange_WindowCount_KS`.
+    """
+
+    signals_j, signals_wc = _extractAllJMeasuresAndWindowCounts(log,measure_window,activityName_key, show_progress_bar=show_progress_bar, progressBarPos=progressBarPos)
+    return (
+        detectChange_AvgSeries(signals_j, windowSize, pvalue, stats.ks_2samp, return_pvalues, show_progress_bar=show_progress_bar, progressBarPos=progressBarPos),
+        detectChange_AvgSeries(signals_wc, windowSize, pvalue, stats.ks_2samp, return_pvalues, show_progress_bar=show_progress_bar, progressBarPos=progressBarPos)
+    )
+
 def detectChange_JMeasure_MU(log:EventLog, windowSize:int, pvalue:float, return_pvalues:bool=False, measure_window:int=None, activityName_key:str=xes.DEFAULT_NAME_KEY, show_progress_bar:bool=True, progressBarPos:int=None)->Union[List[int], Tuple[List[int], np.ndarray]]:
     """Apply Concept Drift Detection using the J-Measure and the Mann-Whitney U-Test.
 
@@ -676,6 +735,33 @@ def detectChange_ADWIN_WindowCount_KS(log:EventLog, min_window:int, max_window:i
     signals = _extractAllWindowCounts(log,measure_window,activityName_key, show_progress_bar=show_progress_bar, progressBarPos=progressBarPos)
     return detectChange_AvgSeries_ADWIN(signals, min_window, max_window, pvalue, step_size, stats.ks_2samp, return_pvalues, show_progress_bar=show_progress_bar, progressBarPos=progressBarPos)
 
+def detectChange_ADWIN_Both_KS(log:EventLog, min_window:int, max_window:int, pvalue:float, step_size:int, return_pvalues:bool=False, measure_window:int=None, activityName_key:str=xes.DEFAULT_NAME_KEY, show_progress_bar:bool=True, progressBarPos:int=None)->Tuple[Union[List[int], Tuple[List[int], np.ndarray]], Union[List[int], Tuple[List[int], np.ndarray]]]:
+    """Apply Concept Drift Detection using both the J-Measure and the Window Count with the Kolmogorov-Smirnov test and an adaptive window. Equivalent to calling `detectChange_ADWIN_JMeasure_KS` and `detectChange_ADWIN_WindowCount_KS`, but the measures are extracted in a single pass.
+
+    Args:
+        log (EventLog): The log on which to apply the concept drift detection.
+        min_window (int): The minimal size of the sliding window for the statistical test using an adaptive window; i.e. the size of the compared populations.
+        max_window (int): The maximal size of the sliding window for the statistical test using an adaptive window; i.e. the size of the compared populations.
+        pvalue (float): The p-value threshold for statistical testing. If the p-value of the statistical test is below this threshold, a changepoint is detected.
+        step_size (int): The step size for increasing the window size in the ADWIN Algorithm.
+        return_pvalues (bool, optional): If True, the p-values of the statistical tests are returned. Defaults to False.
+        measure_window (int, optional): The window size to use for the measure extraction. If `None`, defaults to average trace length in the log. Defaults to None.
+        activityName_key (str, optional): The key for the activity value in the event log. Defaults to xes.DEFAULT_NAME_KEY.
+        show_progress_bar (bool, optional): Configures whether or not to show a progress bar. Defaults to True.
+        progressBarPos (int, optional): The `pos` parameter for tqdm progress bars. The "line" in which to show the bar. Defaults to None.
+
+    Returns:
+        Tuple: The results for the J-Measure and for the Window Count, each as returned by `detectChange_ADWIN_JMeasure_KS` and `detectChange_ADWIN_WindowCount_KS`.
+    """
+
+    if len(log) <= 2*min_window:
+        raise ValueError("The log is too short to apply the ADWIN algorithm. It must contain at more than 2*min_window traces.")
+    signals_j, signals_wc = _extractAllJMeasuresAndWindowCounts(log,measure_window,activityName_key, show_progress_bar=show_progress_bar, progressBarPos=progressBarPos)
+    return (
+        detectChange_AvgSeries_ADWIN(signals_j, min_window, max_window, pvalue, step_size, stats.ks_2samp, return_pvalues, show_progress_bar=show_progress_bar, progressBarPos=progressBarPos),
+        detectChange_AvgSeries_ADWIN(signals_wc, min_window, max_window, pvalue, step_size, stats.ks_2samp, return_pvalues, show_progress_bar=show_progress_bar, progressBarPos=progressBarPos)
+    )
+
 def detectChange_ADWIN_JMeasure_MU(log:EventLog, min_window:int, max_window:int, pvalue:float, step_size:int, return_pvalues:bool=False, measure_window:int=None, activityName_key:str=xes.DEFAULT_NAME_KEY, show_progress_bar:bool=True, progressBarPos:int=None)->Union[List[int], Tuple[List[int], np.ndarray]]:
     """Apply Concept Drift Detection using the J-Measure and the Mann-Whitney U-Test.
 
@@ -262,6 +262,33 @@ def get_avg_lag(detected_changepoints:List[int], actual_changepoints:List[int],
     except ZeroDivisionError:
         return np.nan;
 
+def calcF1_AvgLag(detected:List[int], known:List[int], lag:int, zero_division=np.NaN)->Tuple[float, float]:
+    """Calculates the F1-Score and the average lag of a detection result at once. Equivalent to `F1_Score` and `get_avg_lag`, but the assignment of detected change points to actual change points is only calculated once, and skipped entirely if either list is empty.
+
+    Args:
+        detected (List[int]): List of indices of detected change point locations.
+        known (List[int]): The ground truth; List of indices of actual change points.
+        lag (int): The maximal distance a detected change point can have to an actual change point, whilst still counting as a true positive.
+        zero_division (Any, optional): The value to yield for the F1-Score when a zero-division is encountered. Defaults to np.NaN.
+
+    Returns:
+        Tuple[float, float]: Tuple of: (F1-Score, average lag). The average lag is NaN if there are no true positives.
+    """
+    if len(detected) == 0 or len(known) == 0:
+        # No assignments possible, so precision or recall divide by zero and the average lag is undefined
+        return zero_division, np.nan
+
+    assignments = assign_changepoints(detected, known, lag_window=lag)
+    TP = len(assignments)
+    if TP == 0:
+        return zero_division, np.nan
+
+    precision = TP / len(detected)
+    recall = TP / len(known)
+    f1_score = (2*precision*recall)/(precision+recall)
+    avg_lag = sum(abs(dc-ap) for dc, ap in assignments) / TP
+    return f1_score, avg_lag
+
 
 def getROCData(lag:int, df:pd.DataFrame, undefined_equals=0)->List[Tuple[float,float]]:
     """Returns a list of points, as tuples of Recall (TPR) and Precision (Cannot do FPR because negatives are not really defined for concept drift detection/negatives are practically the entire log (`len(log)-len(detected)`))
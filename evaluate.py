@@ -161,7 +161,7 @@ def evaluate(csv_path="algorithm_results.csv", out_path="Evaluation_Results", la
     for logpath in tqdm(_logpaths, "Calculating Log Lengths. Completed Logs: "):
         log = importLog(logpath.as_posix(), verbose=False)
         loglengths[logpath] = len(log)
-        loglengths_events[logpath] = len([evt for case in log for evt in case])
+        loglengths_events[logpath] = sum(map(len, log)) # Number of events, without building a flat list of them
 
     if verbose:
         print(f"Number of Logs: {len(loglengths.keys())}")
@@ -1,12 +1,15 @@
 import argparse
 import math
-from multiprocessing import Pool, RLock, freeze_support, cpu_count
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from multiprocessing import RLock, Value, freeze_support, cpu_count
 from timeit import default_timer
 
+import matplotlib
+matplotlib.use('Agg') # Only saving figures, no GUI needed
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import ast
+from numba import njit
 
 
 # CDrift Approaches
@@ -24,10 +27,18 @@ from cdrift.utils import helpers
 
 #Misc
 import os
+import gc
+import atexit
+import functools
+import json
+import csv
+import queue
+import threading
 from datetime import datetime
 from tqdm import tqdm
-from pathlib import Path
-from itertools import product
+from pathlib import Path, PurePosixPath
+from itertools import product, islice
+from collections import defaultdict
 import yaml
 
 #################################
@@ -68,49 +79,55 @@ def plotPvals(pvals, changepoints, actual_changepoints, path, xlabel="", ylabel=
                 Boolean whether y axis should autoscale by matplotlib (True) or be limited (0,max(pvals)+0.1) (False)
     """
     # Plotting Configuration
-    fig = plt.figure(figsize=(10,4))
-    plt.plot(pvals)
+    fig, ax = plt.subplots(figsize=(10,4))
+    ax.plot(pvals)
     # Not hardcoded 0-1 because of earthmovers distance (and +.1 so 1 is also drawn)
     if not autoScale:
-        plt.ylim(0,max(pvals)+.1)
-    for cp in changepoints:
-        plt.axvline(x=cp, color='red', alpha=0.5)
-    for actual_cp in actual_changepoints:
-        plt.axvline(x=actual_cp, color='gray', alpha=0.3)
-    plt.xlabel(xlabel)
-    plt.ylabel(ylabel)
-    plt.savefig(f"{path}")
-    plt.close()
+        ax.set_ylim(0,max(pvals)+.1)
+    # Vertical lines spanning the whole y axis, like axvline, but a single artist for all change points
+    ax.vlines(changepoints, 0, 1, transform=ax.get_xaxis_transform(), colors='red', alpha=0.5)
+    ax.vlines(actual_changepoints, 0, 1, transform=ax.get_xaxis_transform(), colors='gray', alpha=0.3)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    fig.savefig(f"{path}")
+    plt.close(fig)
 
 #################################
 ##### Evaluation Functions ######
 #################################
 
-def testBose(filepath, window_size, step_size, F1_LAG, cp_locations, do_j:bool=True, do_wc:bool=True, position=None, show_progress_bar=True):
+def testBose(filepath, log_source, logname, window_size, step_size, F1_LAG, cp_locations, do_j:bool=True, do_wc:bool=True, position=None, show_progress_bar=True):
     j_dur = 0
     wc_dur = 0
 
     log = helpers.importLog(filepath, verbose=False)
-    logname = filepath.split('/')[-1].split('.')[0]
     entries = []
 
+    # J and WC are timed in separate runs, as the durations of both are compared in the evaluation
     if do_j:
         j_start = default_timer()
         pvals_j = bose.detectChange_JMeasure_KS_Step(log, window_size, step_size=step_size, show_progress_bar=show_progress_bar, progressBarPos=position)
         cp_j = bose.visualInspection_Step(pvals_j, window_size, step_size)
         j_dur = default_timer() - j_start
+    if do_wc:
+        wc_start = default_timer()
+        pvals_wc = bose.detectChange_WC_KS_Step(log, window_size, step_size=step_size, show_progress_bar=show_progress_bar, progressBarPos=position)
+        cp_wc = bose.visualInspection_Step(pvals_wc, window_size, step_size)
+        wc_dur = default_timer() - wc_start
 
+    if do_j:
         durStr_J = calcDurFromSeconds(j_dur)
+        f1, avg_lag = evaluation.calcF1_AvgLag(cp_j, cp_locations, F1_LAG)
         new_entry_j = {
             'Algorithm':"Bose J",
-            'Log Source': Path(filepath).parent.name,
+            'Log Source': log_source,
             'Log': logname,
             'Window Size': window_size,
             'SW Step Size': step_size,
             'Detected Changepoints': cp_j,
             'Actual Changepoints for Log': cp_locations,
-            'F1-Score': evaluation.F1_Score(detected=cp_j, known=cp_locations, lag=F1_LAG, zero_division=np.NaN),
-            'Average Lag': evaluation.get_avg_lag(detected_changepoints=cp_j, actual_changepoints=cp_locations, lag=F1_LAG),
+            'F1-Score': f1,
+            'Average Lag': avg_lag,
             'Duration': durStr_J,
             'Duration (Seconds)': j_dur,
             'Seconds per Case': j_dur / len(log)
@@ -118,56 +135,55 @@ def testBose(filepath, window_size, step_size, F1_LAG, cp_locations, do_j:bool=T
         entries.append(new_entry_j)
 
     if do_wc:
-        wc_start = default_timer()
-        pvals_wc = bose.detectChange_WC_KS_Step(log, window_size, step_size=step_size, show_progress_bar=show_progress_bar, progressBarPos=position)
-        cp_wc = bose.visualInspection_Step(pvals_wc, window_size, step_size)
-        wc_dur = default_timer() - wc_start
-
         durStr_WC = calcDurFromSeconds(wc_dur)
+        f1, avg_lag = evaluation.calcF1_AvgLag(cp_wc, cp_locations, F1_LAG)
         new_entry_wc = {
             'Algorithm':"Bose WC", 
-            'Log Source': Path(filepath).parent.name,
+            'Log Source': log_source,
             'Log': logname,
             'Window Size': window_size,
             'SW Step Size': step_size,
             'Detected Changepoints': cp_wc,
             'Actual Changepoints for Log': cp_locations,
-            'F1-Score': evaluation.F1_Score(detected=cp_wc, known=cp_locations, lag=F1_LAG, zero_division=np.NaN),
-            'Average Lag': evaluation.get_avg_lag(detected_changepoints=cp_wc, actual_changepoints=cp_locations, lag=F1_LAG),
+            'F1-Score': f1,
+            'Average Lag': avg_lag,
             'Duration': durStr_WC,
             'Duration (Seconds)': wc_dur,
             'Seconds per Case': wc_dur / len(log)
         }
         entries.append(new_entry_wc)
 
-    if os.path.exists("Reproducibility_Intermediate_Results"):
-        pd.DataFrame(entries).to_csv(Path("Reproducibility_Intermediate_Results", "Bose",f"{logname}_WIN{window_size}.csv"), index=False)
-
     return entries
 
-def testMartjushev(filepath, window_size, F1_LAG, cp_locations, do_j:bool=True, do_wc:bool=True, position=None, show_progress_bar=True):
+def testMartjushev(filepath, log_source, logname, window_size, F1_LAG, cp_locations, do_j:bool=True, do_wc:bool=True, position=None, show_progress_bar=True):
     PVAL = 0.55
     log = helpers.importLog(filepath, verbose=False)
-    logname = filepath.split('/')[-1].split('.')[0]
 
     entries = []
 
+    # J and WC are timed in separate runs, as the durations of both are compared in the evaluation
     if do_j:
         j_start = default_timer()
         rb_j_cp = martjushev.detectChange_JMeasure_KS(log, window_size, PVAL, return_pvalues=False, show_progress_bar=show_progress_bar, progressBarPos=position)
         j_dur = default_timer() - j_start
+    if do_wc:
+        wc_start = default_timer()
+        rb_wc_cp = martjushev.detectChange_WindowCount_KS(log, window_size, PVAL, return_pvalues=False, show_progress_bar=show_progress_bar, progressBarPos=position)
+        wc_dur = default_timer() - wc_start
 
+    if do_j:
         durStr_J = calcDurFromSeconds(j_dur)
+        f1, avg_lag = evaluation.calcF1_AvgLag(rb_j_cp, cp_locations, F1_LAG)
         new_entry_j = {
             'Algorithm':"Martjushev J", 
-            'Log Source': Path(filepath).parent.name,
+            'Log Source': log_source,
             'Log': logname,
             'P-Value': PVAL,
             'Window Size': window_size,
             'Detected Changepoints': rb_j_cp,
             'Actual Changepoints for Log': cp_locations,
-            'F1-Score': evaluation.F1_Score(detected=rb_j_cp, known=cp_locations, lag=F1_LAG, zero_division=np.NaN),
-            'Average Lag': evaluation.get_avg_lag(detected_changepoints=rb_j_cp, actual_changepoints=cp_locations, lag=F1_LAG),
+            'F1-Score': f1,
+            'Average Lag': avg_lag,
             'Duration': durStr_J,
             'Duration (Seconds)': j_dur,
             'Seconds per Case': j_dur / len(log)
@@ -175,53 +191,53 @@ def testMartjushev(filepath, window_size, F1_LAG, cp_locations, do_j:bool=True,
         entries.append(new_entry_j)
 
     if do_wc:
-        wc_start = default_timer()
-        rb_wc_cp = martjushev.detectChange_WindowCount_KS(log, window_size, PVAL, return_pvalues=False, show_progress_bar=show_progress_bar, progressBarPos=position)
-        wc_dur = default_timer() - wc_start
-
         durStr_WC = calcDurFromSeconds(wc_dur)
+        f1, avg_lag = evaluation.calcF1_AvgLag(rb_wc_cp, cp_locations, F1_LAG)
         new_entry_wc = {
             'Algorithm':"Martjushev WC", 
-            'Log Source': Path(filepath).parent.name,
+            'Log Source': log_source,
             'Log': logname,
             'P-Value': PVAL,
             'Window Size': window_size,
             'Detected Changepoints': rb_wc_cp,
             'Actual Changepoints for Log': cp_locations,
-            'F1-Score': evaluation.F1_Score(detected=rb_wc_cp, known=cp_locations, lag=F1_LAG, zero_division=np.NaN),
-            'Average Lag': evaluation.get_avg_lag(detected_changepoints=rb_wc_cp, actual_changepoints=cp_locations, lag=F1_LAG),
+            'F1-Score': f1,
+            'Average Lag': avg_lag,
             'Duration': durStr_WC,
             'Duration (Seconds)': wc_dur,
             'Seconds per Case': wc_dur / len(log)
         }
         entries.append(new_entry_wc)
 
-    if os.path.exists("Reproducibility_Intermediate_Results"):
-        pd.DataFrame(entries).to_csv(Path("Reproducibility_Intermediate_Results", "Martjushev", f"{logname}_WIN{window_size}.csv"), index=False)
     return entries
 
-def testMartjushev_ADWIN(filepath, min_max_window_pair, pvalue, step_size, F1_LAG, cp_locations, do_j:bool=True, do_wc:bool=True, position=None, show_progress_bar=True):
+def testMartjushev_ADWIN(filepath, log_source, logname, min_max_window_pair, pvalue, step_size, F1_LAG, cp_locations, do_j:bool=True, do_wc:bool=True, position=None, show_progress_bar=True):
     log = helpers.importLog(filepath, verbose=False)
 
     min_window, max_window = min_max_window_pair
 
     if len(log) <= min_window:
         # If the log is too short, we can't use the ADWIN algorithm because even the initial windows do not fit
-        return np.NaN
-
-    logname = filepath.split('/')[-1].split('.')[0]
+        return None
 
     entries = []
 
+    # J and WC are timed in separate runs, as the durations of both are compared in the evaluation
     if do_j:
         j_start = default_timer()
         adwin_j_cp = martjushev.detectChange_ADWIN_JMeasure_KS(log, min_window, max_window, pvalue, step_size, return_pvalues=False, show_progress_bar=show_progress_bar, progressBarPos=position)
         j_dur = default_timer() - j_start
+    if do_wc:
+        wc_start = default_timer()
+        adwin_wc_cp = martjushev.detectChange_ADWIN_WindowCount_KS(log, min_window, max_window, pvalue, step_size, return_pvalues=False, show_progress_bar=show_progress_bar, progressBarPos=position)
+        wc_dur = default_timer() - wc_start
 
+    if do_j:
         durStr_J = calcDurFromSeconds(j_dur)
+        f1, avg_lag = evaluation.calcF1_AvgLag(adwin_j_cp, cp_locations, F1_LAG)
         new_entry_j = {
             'Algorithm':"Martjushev ADWIN J", 
-            'Log Source': Path(filepath).parent.name,
+            'Log Source': log_source,
             'Log': logname,
             'P-Value': pvalue,
             'Min Adaptive Window': min_window,
@@ -229,8 +245,8 @@ def testMartjushev_ADWIN(filepath, min_max_window_pair, pvalue, step_size, F1_LA
             'ADWIN Step Size': step_size,
             'Detected Changepoints': adwin_j_cp,
             'Actual Changepoints for Log': cp_locations,
-            'F1-Score': evaluation.F1_Score(detected=adwin_j_cp, known=cp_locations, lag=F1_LAG, zero_division=np.NaN),
-            'Average Lag': evaluation.get_avg_lag(detected_changepoints=adwin_j_cp, actual_changepoints=cp_locations, lag=F1_LAG),
+            'F1-Score': f1,
+            'Average Lag': avg_lag,
             'Duration': durStr_J,
             'Duration (Seconds)': j_dur,
             'Seconds per Case': j_dur / len(log)
@@ -238,14 +254,11 @@ def testMartjushev_ADWIN(filepath, min_max_window_pair, pvalue, step_size, F1_LA
         entries.append(new_entry_j)
 
     if do_wc:
-        wc_start = default_timer()
-        adwin_wc_cp = martjushev.detectChange_ADWIN_WindowCount_KS(log, min_window, max_window, pvalue, step_size, return_pvalues=False, show_progress_bar=show_progress_bar, progressBarPos=position)
-        wc_dur = default_timer() - wc_start
-
         durStr_WC = calcDurFromSeconds(wc_dur)
+        f1, avg_lag = evaluation.calcF1_AvgLag(adwin_wc_cp, cp_locations, F1_LAG)
         new_entry_wc = {
             'Algorithm':"Martjushev ADWIN WC", 
-            'Log Source': Path(filepath).parent.name,
+            'Log Source': log_source,
             'Log': logname,
             'P-Value': pvalue,
             'Min Adaptive Window': min_window,
@@ -253,20 +266,60 @@ def testMartjushev_ADWIN(filepath, min_max_window_pair, pvalue, step_size, F1_LA
             'ADWIN Step Size': step_size,
             'Detected Changepoints': adwin_wc_cp,
             'Actual Changepoints for Log': cp_locations,
-            'F1-Score': evaluation.F1_Score(detected=adwin_wc_cp, known=cp_locations, lag=F1_LAG, zero_division=np.NaN),
-            'Average Lag': evaluation.get_avg_lag(detected_changepoints=adwin_wc_cp, actual_changepoints=cp_locations, lag=F1_LAG),
+            'F1-Score': f1,
+            'Average Lag': avg_lag,
             'Duration': durStr_WC,
             'Duration (Seconds)': wc_dur,
             'Seconds per Case': wc_dur / len(log)
         }
         entries.append(new_entry_wc)
 
-    if os.path.exists("Reproducibility_Intermediate_Results"):
-        pd.DataFrame(entries).to_csv(Path("Reproducibility_Intermediate_Results", "Martjushev ADWIN", f"{logname}_MINW{min_window}_MAXW{max_window}.csv"), index=False)
-
     return entries
 
 
+@njit(cache=True)
+def _merge_change_points(cps, wss, masks, alpha):
+    """
+    Merge kernel of `aggregate_change_points_by_window`. Expects the change points sorted by descending window size, then cp.
+
+    Each change point is merged into the closest change point of a smaller window size within `window_size * alpha`.
+    The supporting windows of each change point are a bitmask over the window sizes (`masks`), combined by bitwise or.
+
+    Returns the cp, window_size, support and supporting window mask of the surviving change points.
+    """
+    n = len(cps)
+    support = np.ones(n, dtype=np.int64)
+    masks = masks.copy()
+    out_cp = np.empty(n, dtype=np.int64)
+    out_ws = np.empty(n, dtype=np.int64)
+    out_sup = np.empty(n, dtype=np.int64)
+    out_mask = np.empty(n, dtype=np.uint64)
+    num_out = 0
+
+    for i in range(n):
+        # Find the closest merge candidate in smaller window sizes
+        closest = -1
+        closest_dist = 0
+        for j in range(i + 1, n):
+            if wss[j] >= wss[i]:
+                continue  # only merge into smaller window
+            dist = abs(cps[i] - cps[j])
+            if dist <= wss[i] * alpha and (closest == -1 or dist < closest_dist):
+                closest = j
+                closest_dist = dist
+
+        if closest != -1:
+            support[closest] += support[i]
+            masks[closest] |= masks[i]
+        else:
+            out_cp[num_out] = cps[i]
+            out_ws[num_out] = wss[i]
+            out_sup[num_out] = support[i]
+            out_mask[num_out] = masks[i]
+            num_out += 1
+
+    return out_cp[:num_out], out_ws[:num_out], out_sup[:num_out], out_mask[:num_out]
+
 def aggregate_change_points_by_window(cp_all_window_sizes, alpha=1.0):
     """
     Aggregates change points across window sizes by merging close ones,
@@ -274,50 +327,42 @@ def aggregate_change_points_by_window(cp_all_window_sizes, alpha=1.0):
 
     Returns a DataFrame with cp, window_size, support.
     """
+    columns = ["cp", "window_size", "support", "supporting_windows"]
     if not cp_all_window_sizes:
-        return pd.DataFrame(columns=["cp", "window_size", "support", "supporting_windows"])
-
-    max_ws = max(cp_all_window_sizes.keys())
-
-    # Step 1: Flatten and initialize support + support set
-    records = []
-    for ws, cp_list in cp_all_window_sizes.items():
-        for cp in cp_list:
-            support = 1
-            records.append({
-                "cp": cp,
-                "window_size": ws,
-                "support": support,
-                "supporting_windows": {ws}
-            })
-
-    # Sort by descending window size, then cp
-    records.sort(key=lambda x: (-x["window_size"], x["cp"]))
-
-    merged_records = []
-
-    for i, rec_a in enumerate(records):
-        candidates = []
-
-        # Find merge candidates in smaller window sizes
-        for j in range(i + 1, len(records)):
-            rec_b = records[j]
-            if rec_b["window_size"] >= rec_a["window_size"]:
-                continue  # only merge into smaller window
-
-            dist = abs(rec_a["cp"] - rec_b["cp"])
-            if dist <= rec_a["window_size"] * alpha:
-                candidates.append((dist, rec_b))
-
-        # Choose the closest candidate (if any)
-        if candidates:
-            _, closest = min(candidates, key=lambda x: x[0])
-            closest["support"] += rec_a["support"]
-            closest["supporting_windows"] |= rec_a["supporting_windows"]
-        else:
-            merged_records.append(rec_a)
+        return pd.DataFrame(columns=columns)
+
+    # Step 1: Flatten into parallel arrays of change points and their window sizes, sorted by descending window size, then cp
+    # Only the (short, usually already sorted) list of each window size needs sorting, not the whole array
+    window_sizes_desc = sorted(cp_all_window_sizes, reverse=True)
+    cps = np.concatenate([np.sort(np.asarray(cp_all_window_sizes[ws], dtype=np.int64)) for ws in window_sizes_desc])
+    wss = np.repeat(
+        np.array(window_sizes_desc, dtype=np.int64),
+        [len(cp_all_window_sizes[ws]) for ws in window_sizes_desc]
+    )
+    if len(cps) == 0:
+        return pd.DataFrame(columns=columns)
+
+    # Supporting windows are encoded as a bitmask with one bit per window size
+    window_sizes = np.unique(wss)
+    if len(window_sizes) > 64:
+        raise ValueError(f"At most 64 different window sizes can be aggregated, got {len(window_sizes)}")
+    masks = np.left_shift(np.uint64(1), np.searchsorted(window_sizes, wss).astype(np.uint64))
+
+    out_cp, out_ws, out_sup, out_mask = _merge_change_points(cps, wss, masks, float(alpha))
+
+    # Decode the bitmasks back to sets of window sizes
+    window_sizes = window_sizes.tolist()
+    supporting_windows = [
+        {ws for bit, ws in enumerate(window_sizes) if (mask >> bit) & 1}
+        for mask in out_mask.tolist()
+    ]
 
-    return pd.DataFrame(merged_records)
+    return pd.DataFrame({
+        "cp": out_cp,
+        "window_size": out_ws,
+        "support": out_sup,
+        "supporting_windows": supporting_windows
+    }, columns=columns)
 
 # --- Outer filtering function --- #
 
@@ -356,29 +401,27 @@ def deduplicate_change_points_by_window(cp_all_window_sizes, alpha=1.0, min_supp
     return list(filtered_df["cp"])
 
 
-def testEarthMoverMultiWindow(filepath, window_sizes, alpha, min_support_windows, step_size, F1_LAG, cp_locations, position, show_progress_bar=True):
+def testEarthMoverMultiWindow(filepath, log_source, logname, window_sizes, alpha, min_support_windows, step_size, F1_LAG, cp_locations, position, show_progress_bar=True):
     LINE_NR = position
 
     log = helpers.importLog(filepath, verbose=False)
-    logname = filepath.split('/')[-1].split('.')[0]
 
     startTime = default_timer()
 
     # Earth Mover's Distance
-    cp_em_all_window_sizes = {}
-    for window_size in window_sizes:
-        cp_em_single_window_size = earthmover.detect_change(log, window_size, step_size, show_progress_bar=show_progress_bar, progress_bar_pos=LINE_NR)
-        cp_em_all_window_sizes[window_size] = cp_em_single_window_size
-    
+    # All window sizes in one call, so the distances between trace variants are only computed once
+    cp_em_all_window_sizes = earthmover.detect_change_batched(log, window_sizes, step_size, show_progress_bar=show_progress_bar, progress_bar_pos=LINE_NR)
+
     cp_em = deduplicate_change_points_by_window(cp_em_all_window_sizes, alpha, min_support_windows)
 
     endTime = default_timer()
     durStr = calcDurationString(startTime, endTime)
 
     # Save Results #
+    f1, avg_lag = evaluation.calcF1_AvgLag(cp_em, cp_locations, F1_LAG)
     new_entry = {
         'Algorithm':"Earth Mover's Distance Multi Window", 
-        'Log Source': Path(filepath).parent.name,
+        'Log Source': log_source,
         'Log': logname,
         'Window Sizes': f" ".join(map(str, window_sizes)),
         'Alpha': alpha,
@@ -386,24 +429,20 @@ def testEarthMoverMultiWindow(filepath, window_sizes, alpha, min_support_windows
         'SW Step Size': step_size,
         'Detected Changepoints': cp_em,
         'Actual Changepoints for Log': cp_locations,
-        'F1-Score': evaluation.F1_Score(detected=cp_em, known=cp_locations, lag=F1_LAG, zero_division=np.NaN),
-        'Average Lag': evaluation.get_avg_lag(detected_changepoints=cp_em, actual_changepoints=cp_locations, lag=F1_LAG),
+        'F1-Score': f1,
+        'Average Lag': avg_lag,
         'Duration': durStr,
         'Duration (Seconds)': (endTime-startTime),
         'Seconds per Case': (endTime-startTime) / len(log)
     }
 
-    if os.path.exists("Reproducibility_Intermediate_Results"):
-        pd.DataFrame([new_entry]).to_csv(Path("Reproducibility_Intermediate_Results", "EarthmoverMultiWindow", f"{logname}_WIN{min(window_sizes)}TO{max(window_sizes)}.csv"), index=False)
-
     return [new_entry]
 
 
-def testEarthMover(filepath, window_size, step_size, F1_LAG, cp_locations, position, show_progress_bar=True):
+def testEarthMover(filepath, log_source, logname, window_size, step_size, F1_LAG, cp_locations, position, show_progress_bar=True):
     LINE_NR = position
 
     log = helpers.importLog(filepath, verbose=False)
-    logname = filepath.split('/')[-1].split('.')[0]
 
     startTime = default_timer()
 
@@ -414,30 +453,27 @@ def testEarthMover(filepath, window_size, step_size, F1_LAG, cp_locations, posit
     durStr = calcDurationString(startTime, endTime)
 
     # Save Results #
+    f1, avg_lag = evaluation.calcF1_AvgLag(cp_em, cp_locations, F1_LAG)
     new_entry = {
         'Algorithm':"Earth Mover's Distance", 
-        'Log Source': Path(filepath).parent.name,
+        'Log Source': log_source,
         'Log': logname,
         'Window Size': window_size,
         'SW Step Size': step_size,
         'Detected Changepoints': cp_em,
         'Actual Changepoints for Log': cp_locations,
-        'F1-Score': evaluation.F1_Score(detected=cp_em, known=cp_locations, lag=F1_LAG, zero_division=np.NaN),
-        'Average Lag': evaluation.get_avg_lag(detected_changepoints=cp_em, actual_changepoints=cp_locations, lag=F1_LAG),
+        'F1-Score': f1,
+        'Average Lag': avg_lag,
         'Duration': durStr,
         'Duration (Seconds)': (endTime-startTime),
         'Seconds per Case': (endTime-startTime) / len(log)
     }
 
-    if os.path.exists("Reproducibility_Intermediate_Results"):
-        pd.DataFrame([new_entry]).to_csv(Path("Reproducibility_Intermediate_Results", "Earthmover", f"{logname}_WIN{window_size}.csv"), index=False)
-
     return [new_entry]
 
-def testMaaradji(filepath, window_size, step_size, F1_LAG, cp_locations, position, show_progress_bar=True):
+def testMaaradji(filepath, log_source, logname, window_size, step_size, F1_LAG, cp_locations, position, show_progress_bar=True):
 
     log = helpers.importLog(filepath, verbose=False)
-    logname = filepath.split('/')[-1].split('.')[0]
 
     startTime = default_timer()
 
@@ -449,28 +485,26 @@ def testMaaradji(filepath, window_size, step_size, F1_LAG, cp_locations, positio
 
     # Save Results #
 
+    f1, avg_lag = evaluation.calcF1_AvgLag(cp_runs, cp_locations, F1_LAG)
     new_entry = {
         'Algorithm':"Maaradji Runs",
-        'Log Source': Path(filepath).parent.name,
+        'Log Source': log_source,
         'Log': logname,
         'Window Size': window_size,
         'SW Step Size': step_size,
         'Detected Changepoints': cp_runs,
         'Actual Changepoints for Log': cp_locations,
-        'F1-Score': evaluation.F1_Score(detected=cp_runs, known=cp_locations, lag=F1_LAG, zero_division=np.NaN),
-        'Average Lag': evaluation.get_avg_lag(detected_changepoints=cp_runs, actual_changepoints=cp_locations, lag=F1_LAG),
+        'F1-Score': f1,
+        'Average Lag': avg_lag,
         'Duration': durStr,
         'Duration (Seconds)': (endTime-startTime),
         'Seconds per Case': (endTime-startTime) / len(log)
     }
     
-    if os.path.exists("Reproducibility_Intermediate_Results"):
-        pd.DataFrame([new_entry]).to_csv(Path("Reproducibility_Intermediate_Results", "Maaradji", f"{logname}_WIN{window_size}.csv"), index=False)
     return [new_entry]
 
-def testGraphMetrics(filepath, min_max_window_pair, pvalue, F1_LAG, cp_locations, position=None, show_progress_bar=True):
+def testGraphMetrics(filepath, log_source, logname, min_max_window_pair, pvalue, F1_LAG, cp_locations, position=None, show_progress_bar=True):
     log = helpers.importLog(filepath, verbose=False)
-    logname = filepath.split('/')[-1].split('.')[0]
 
     min_window, max_window = min_max_window_pair
 
@@ -483,33 +517,31 @@ def testGraphMetrics(filepath, min_max_window_pair, pvalue, F1_LAG, cp_locations
 
     # Save Results #
 
+    f1, avg_lag = evaluation.calcF1_AvgLag(cp, cp_locations, F1_LAG)
     new_entry = {
         'Algorithm':"Process Graph Metrics", 
-        'Log Source': Path(filepath).parent.name,
+        'Log Source': log_source,
         'Log': logname,
         'P-Value': pvalue,
         'Min Adaptive Window': min_window,
         'Max Adaptive Window': max_window,
         'Detected Changepoints': cp,
         'Actual Changepoints for Log': cp_locations,
-        'F1-Score': evaluation.F1_Score(detected=cp, known=cp_locations, lag=F1_LAG, zero_division=np.NaN),
-        'Average Lag': evaluation.get_avg_lag(detected_changepoints=cp, actual_changepoints=cp_locations, lag=F1_LAG),
+        'F1-Score': f1,
+        'Average Lag': avg_lag,
         'Duration': durStr,
         'Duration (Seconds)': (endTime-startTime),
         'Seconds per Case': (endTime-startTime) / len(log)
     }
 
-    if os.path.exists("Reproducibility_Intermediate_Results"):
-        pd.DataFrame([new_entry]).to_csv(Path("Reproducibility_Intermediate_Results", "ProcessGraph", f"{logname}_P{pvalue}_MINW{min_window}_MAXW{max_window}.csv"), index=False)
     return [new_entry]
 
-def testZhengDBSCAN(filepath, mrid, eps_modifiers, F1_LAG, cp_locations, position, show_progress_bar=True):
+def testZhengDBSCAN(filepath, log_source, logname, mrid, eps_modifiers, F1_LAG, cp_locations, position, show_progress_bar=True):
     # candidateCPDetection is independent of eps, so we can calculate the candidates once and use them for multiple eps!
     epsList = [mrid*meps for meps in eps_modifiers]
 
 
     log = helpers.importLog(filepath, verbose=False)
-    logname = filepath.split('/')[-1].split('.')[0]
 
     startTime = default_timer()
     
@@ -525,32 +557,29 @@ def testZhengDBSCAN(filepath, mrid, eps_modifiers, F1_LAG, cp_locations, positio
     for eps in epsList:
         cp = cps[eps]
 
+        f1, avg_lag = evaluation.calcF1_AvgLag(cp, cp_locations, F1_LAG)
         new_entry = {
             'Algorithm':"Zheng DBSCAN", 
-            'Log Source': Path(filepath).parent.name,
+            'Log Source': log_source,
             'Log': logname,
             'MRID': mrid,
             'Epsilon': eps,
             'Detected Changepoints': cp,
             'Actual Changepoints for Log': cp_locations,
-            'F1-Score': evaluation.F1_Score(detected=cp, known=cp_locations, lag=F1_LAG, zero_division=np.NaN),
-            'Average Lag': evaluation.get_avg_lag(detected_changepoints=cp, actual_changepoints=cp_locations, lag=F1_LAG),
+            'F1-Score': f1,
+            'Average Lag': avg_lag,
             'Duration': durStr,
             'Duration (Seconds)': (endTime-startTime),
             'Seconds per Case': (endTime-startTime) / len(log)
         }
         ret.append(new_entry)
-    if os.path.exists("Reproducibility_Intermediate_Results"):
-        for entry in ret:
-            pd.DataFrame([entry]).to_csv(Path("Reproducibility_Intermediate_Results", "Zheng", f"{logname}_MRID{mrid}_EPS{str(entry['Epsilon']).replace('.','_')}.csv"), index=False)
     return ret
 
-def testLCDD(filepath, window_pairs, stable_period, F1_LAG, cp_locations, position, show_progress_bar=True):
+def testLCDD(filepath, log_source, logname, window_pairs, stable_period, F1_LAG, cp_locations, position, show_progress_bar=True):
 
     complete_window_size, detection_window_size = window_pairs
 
     log = helpers.importLog(filepath, verbose=False)
-    logname = filepath.split('/')[-1].split('.')[0]
 
     startTime = default_timer()
 
@@ -561,26 +590,173 @@ def testLCDD(filepath, window_pairs, stable_period, F1_LAG, cp_locations, positi
 
     # Save Results #
 
+    f1, avg_lag = evaluation.calcF1_AvgLag(cp_lcdd, cp_locations, F1_LAG)
     new_entry = {
         'Algorithm':"LCDD",
-        'Log Source': Path(filepath).parent.name,
+        'Log Source': log_source,
         'Log': logname,
         'Complete-Window Size': complete_window_size,
         'Detection-Window Size': detection_window_size,
         'Stable Period': stable_period,
         'Detected Changepoints': cp_lcdd,
         'Actual Changepoints for Log': cp_locations,
-        'F1-Score': evaluation.F1_Score(detected=cp_lcdd, known=cp_locations, lag=F1_LAG, zero_division=np.NaN),
-        'Average Lag': evaluation.get_avg_lag(detected_changepoints=cp_lcdd, actual_changepoints=cp_locations, lag=F1_LAG),
+        'F1-Score': f1,
+        'Average Lag': avg_lag,
         'Duration': durStr,
         'Duration (Seconds)': (endTime-startTime),
         'Seconds per Case': (endTime-startTime) / len(log)
     }
     
-    if os.path.exists("Reproducibility_Intermediate_Results"):
-        pd.DataFrame([new_entry]).to_csv(Path("Reproducibility_Intermediate_Results", "LCDD", f"{logname}_CW{complete_window_size}_DW{detection_window_size}_SP{stable_period}.csv"), index=False)
     return [new_entry]
 
+# The XES importer, as `helpers.importLog` is replaced by a cached loader in the workers
+_parse_log = helpers.importLog
+
+def _pin_worker(worker_counter, cpus_per_worker:int=1):
+    """Pins the calling worker process to its own set of cores, so that it does not migrate between cores (and NUMA nodes). Memory is then allocated on the node of these cores by the first-touch policy. Only supported on Linux, a no-op elsewhere.
+
+    Args:
+        worker_counter (Value): Shared counter used to hand out a distinct id to each worker.
+        cpus_per_worker (int, optional): The number of cores reserved for each worker, e.g., for inner parallelism. Defaults to 1.
+    """
+    if worker_counter is None or not hasattr(os, "sched_setaffinity"):
+        return
+
+    with worker_counter.get_lock():
+        worker_id = worker_counter.value
+        worker_counter.value += 1
+
+    available_cpus = sorted(os.sched_getaffinity(0))
+    cpus_per_worker = min(cpus_per_worker, len(available_cpus))
+    first = (worker_id * cpus_per_worker) % len(available_cpus)
+    os.sched_setaffinity(0, {available_cpus[(first + i) % len(available_cpus)] for i in range(cpus_per_worker)})
+
+# Number of imported logs each worker keeps. Tasks only carry the path of their log, and a worker receives all tasks of a log in one chunk, so a few logs suffice
+LOG_CACHE_SIZE = 4
+
+def _init_worker(lock, worker_counter=None, cpus_per_worker:int=1):
+    """Initializer for the workers of the evaluation pool. Shares the lock of the progress bars and throttles their refreshes, pins the worker to its cores, and caches imported event logs, so that tasks on the same log do not parse it again.
+
+    Args:
+        lock (RLock): The lock used by tqdm.
+        worker_counter (Value, optional): Shared counter to assign the cores of each worker. If None, workers are not pinned. Defaults to None.
+        cpus_per_worker (int, optional): The number of cores reserved for each worker. Defaults to 1.
+    """
+    tqdm.set_lock(lock)
+    # Refresh the progress bars of the tasks less often, as every refresh acquires the shared lock. Arguments passed explicitly still take precedence
+    tqdm.__init__ = functools.partialmethod(tqdm.__init__, mininterval=1.0, miniters=1024, leave=False)
+    _pin_worker(worker_counter, cpus_per_worker)
+    helpers.importLog = functools.lru_cache(maxsize=LOG_CACHE_SIZE)(_parse_log)
+
+# Pool of the evaluation workers, created on first use and reused by later runs in this process
+_POOL = None
+_POOL_CONFIG = None # (num_cores, inner_budget, threads) of the pool
+
+def get_pool(num_cores:int, inner_budget:int=1, threads:bool=False):
+    """Returns the pool of evaluation workers, creating it on first use. The workers (and their caches of imported logs) are reused by later calls.
+
+    Args:
+        num_cores (int): The number of workers. If the existing pool has a different number of workers, it is replaced.
+        inner_budget (int, optional): The number of cores reserved for each worker. If the existing pool was created with a different budget, it is replaced. Defaults to 1.
+        threads (bool, optional): If True, the workers are threads of this process instead of processes. Arguments and results are then not pickled and logs are cached once for all workers, but only detectors that release the GIL run in parallel. Defaults to False.
+
+    Returns:
+        Executor: The pool of evaluation workers.
+    """
+    global _POOL, _POOL_CONFIG
+    if _POOL is not None and _POOL_CONFIG != (num_cores, inner_budget, threads):
+        close_pool()
+    if _POOL is None:
+        if threads:
+            # All threads share the cache of imported logs
+            helpers.importLog = functools.lru_cache(maxsize=num_cores)(_parse_log)
+            _POOL = ThreadPoolExecutor(num_cores)
+        else:
+            tqdm.set_lock(RLock())
+            # Move the objects of this process out of reach of the garbage collector before forking, so collections in the workers do not write to (and thereby copy) the inherited memory pages.
+            # The executor forks its workers as tasks are submitted, so the objects stay frozen until the pool is closed. The workers load their logs themselves (see _init_worker)
+            gc.freeze()
+            _POOL = ProcessPoolExecutor(num_cores, initializer=_init_worker, initargs=(tqdm.get_lock(), Value('i', 0), inner_budget))
+        _POOL_CONFIG = (num_cores, inner_budget, threads)
+    return _POOL
+
+def close_pool(terminate:bool=False):
+    """Shuts down the pool of evaluation workers, if it exists. Restores the importer of event logs that a pool of threads replaced with its shared cache.
+
+    Args:
+        terminate (bool, optional): If True, pending tasks are cancelled and worker processes are killed, which stops their running tasks, instead of finishing all outstanding tasks. Threads can not be killed, their running tasks are not waited for. Defaults to False.
+    """
+    global _POOL, _POOL_CONFIG
+    if _POOL is None:
+        return
+    if terminate and isinstance(_POOL, ProcessPoolExecutor):
+        # Shutting down does not stop the running tasks, nor those already sent to the workers
+        for process in list((_POOL._processes or dict()).values()):
+            process.terminate()
+        _POOL.shutdown(wait=True, cancel_futures=True)
+    else:
+        _POOL.shutdown(wait=not terminate, cancel_futures=terminate)
+    gc.unfreeze()
+    # Releases the logs cached by the threads
+    helpers.importLog = _parse_log
+    _POOL = None
+    _POOL_CONFIG = None
+
+atexit.register(close_pool)
+
+# Columns of the intermediate results holding lists of change points
+CHANGEPOINT_COLUMNS = ['Detected Changepoints', 'Actual Changepoints for Log']
+
+def _intermediate_table(rows, schema=None):
+    """Converts intermediate result rows to a pyarrow Table.
+
+    Args:
+        rows (List[Dict]): The result rows.
+        schema (pyarrow.Schema, optional): The schema of the table. If None, it is inferred from the rows, with the change point columns as lists of integers, and columns without any value as floats (the schema of a file can not change when rows with values are appended later). Defaults to None.
+
+    Returns:
+        pyarrow.Table: The table of the rows.
+    """
+    import pyarrow as pa # Only needed when writing Parquet
+
+    if schema is None:
+        schema = pa.Table.from_pylist(rows).schema
+        for column in CHANGEPOINT_COLUMNS:
+            index = schema.get_field_index(column)
+            if index >= 0:
+                schema = schema.set(index, pa.field(column, pa.list_(pa.int64())))
+        # Optional parameters are numbers if they are set
+        for index, field in enumerate(schema):
+            if pa.types.is_null(field.type):
+                schema = schema.set(index, pa.field(field.name, pa.float64()))
+    return pa.Table.from_pylist(rows, schema=schema)
+
+def flush_intermediate_results(intermediate_rows, written_files, parquet:bool=False):
+    """Writes the buffered intermediate results, one file per approach and log, and empties the buffer.
+
+    Args:
+        intermediate_rows (Dict[Tuple[str,str],List[Dict]]): Result rows, keyed by the directory of the approach and the name of the log.
+        written_files (Set[Tuple[str,str]]): Keys whose file has already been written in this run; rows for these keys are appended. Updated in place.
+        parquet (bool, optional): If True, results are written to Parquet files instead of CSV files. Each file is closed once written, a Parquet file that is appended to is rewritten as a whole. Defaults to False.
+    """
+    for key, rows in intermediate_rows.items():
+        approach, logname = key
+        is_first_write = key not in written_files
+        if not parquet:
+            pd.DataFrame(rows).to_csv(Path("Reproducibility_Intermediate_Results", approach, f"{logname}.csv"), index=False, mode='w' if is_first_write else 'a', header=is_first_write)
+        else:
+            import pyarrow as pa, pyarrow.parquet as pq # Only needed when writing Parquet
+            path = Path("Reproducibility_Intermediate_Results", approach, f"{logname}.parquet")
+            if is_first_write:
+                table = _intermediate_table(rows)
+            else:
+                # Only happens if the tasks of a log were split across chunks
+                written = pq.read_table(path)
+                table = pa.concat_tables([written, _intermediate_table(rows, schema=written.schema)])
+            pq.write_table(table, path)
+        written_files.add(key)
+    intermediate_rows.clear()
+
 def callFunction(arg):
     """Wrapper for testing functions, as for the multiprocessing pool, one can only use one function, not multiple
 
@@ -589,7 +765,24 @@ def callFunction(arg):
         vals (Tuple[str,List]): Tuple of name of the approach, and its parameter values
     """
     funcname, args = arg
-    return globals()[funcname](**args)
+    result = globals()[funcname](**args)
+    # Approaches return None if they are not applicable to the log; these tasks have no results
+    return [] if result is None else result
+
+def callFunctionChunk(indexed_args):
+    """
+        Wrapper around `callFunction` for a chunk of tasks. Returns the index of each task with its result, as the chunks complete out of order
+    """
+    return [(idx, callFunction(arg)) for idx, arg in indexed_args]
+
+def _parse_changepoints(value):
+    """
+        Parses a list of change points from the gold standard, e.g. "[1399, 2176]". Returns an empty list if the value is not a valid list
+    """
+    try:
+        return json.loads(value)
+    except (TypeError, ValueError):
+        return []
 
 def get_logpaths_with_changepoints():
     # Setup all Paths to logs alongside their change point locations
@@ -597,18 +790,21 @@ def get_logpaths_with_changepoints():
         (Path("EvaluationLogs","Bose", "bose_log.xes.gz").as_posix(), [1199, 2399, 3599, 4799]), # A change every 1200 cases, 6000 cases in total (Skipping 5999 because a change on the last case doesnt make sense)
     ]
 
-    ceravolo_root = Path("EvaluationLogs","Ceravolo")
-    for item in ceravolo_root.iterdir():
-        _, _, _,num_cases, _ = item.stem.split("_")
-        if int(num_cases) != 1000: # Only use logs of length 1000
-            continue
-        drift_indices = [(int(num_cases)//2) - 1] # "The first half of the stream is composed of the baseline model, and the second half is composed of the drifted model"
-        logPaths_Changepoints.append((item.as_posix(), drift_indices))
-    
-    logPaths_Changepoints += [
-        (item.as_posix(), [999,1999])
-        for item in Path("EvaluationLogs","Ostovar").iterdir()
-    ]
+    ceravolo_root = Path("EvaluationLogs","Ceravolo").as_posix()
+    with os.scandir(ceravolo_root) as entries:
+        for entry in entries:
+            _, _, _,num_cases, _ = entry.name.split("_")
+            if int(num_cases) != 1000: # Only use logs of length 1000
+                continue
+            drift_indices = [(int(num_cases)//2) - 1] # "The first half of the stream is composed of the baseline model, and the second half is composed of the drifted model"
+            logPaths_Changepoints.append((f"{ceravolo_root}/{entry.name}", drift_indices))
+
+    ostovar_root = Path("EvaluationLogs","Ostovar").as_posix()
+    with os.scandir(ostovar_root) as entries:
+        logPaths_Changepoints += [
+            (f"{ostovar_root}/{entry.name}", [999,1999])
+            for entry in entries
+        ]
 
     # Get true change points for Kraus synthetic dataset
     # Path to the gold_standard.csv for Kraus
@@ -620,20 +816,14 @@ def get_logpaths_with_changepoints():
     # Folder where the actual .xes.gz files are stored
     log_folder = gold_standard_path.parent
 
-    # Append entries from CSV
-    for _, row in df.iterrows():
-        # Construct full path
-        log_name = row["log_name"]
-        full_path = (log_folder / log_name).as_posix()
-
-        # Parse list of change points
-        try:
-            changepoints = ast.literal_eval(row["change_point"])
-        except (ValueError, SyntaxError):
-            changepoints = []
+    # Parse the lists of change points, e.g. "[1399, 2176]"
+    changepoints = df["change_point"].map(_parse_changepoints)
 
-        # Append tuple
-        logPaths_Changepoints.append((full_path, changepoints))
+    # Append entries from CSV
+    logPaths_Changepoints.extend(zip(
+        ((log_folder / log_name).as_posix() for log_name in df["log_name"]),
+        changepoints
+    ))
 
     return logPaths_Changepoints
 
@@ -641,15 +831,14 @@ def get_logpaths_with_changepoints():
 def build_arguments_list(config, logPaths_Changepoints, is_test_run=False):
     _args = { approach["function"]: (approach.get("meta-params", dict()), approach["params"]) for approach in config["approaches"].values() if approach.get("enabled", True) == True }
 
+    # Parameters of each task, without the log-specific arguments
     arguments = []
     for funcname, (meta_args, args) in _args.items():
         keys, values = zip(*args.items())
-        permutations_dicts = [dict(zip(keys, v)) for v in product(*values)]
-
+        permutations = product(*values)
         if is_test_run:
-            arguments += [(funcname, permutation | meta_args) for permutation in permutations_dicts[:1]]
-        else:
-            arguments += [(funcname, permutation | meta_args) for permutation in permutations_dicts]
+            permutations = islice(permutations, 1)
+        arguments += [(funcname, {**dict(zip(keys, v)), **meta_args}) for v in permutations]
 
     if is_test_run:
         logPaths_Changepoints = logPaths_Changepoints[:1]
@@ -658,45 +847,115 @@ def build_arguments_list(config, logPaths_Changepoints, is_test_run=False):
         {
             "F1_LAG": config["meta-parameters"]["F1_LAG"], # For the per-instance-F1-Score. Not relevant for evaluation anymore.
             "filepath": logpath, # Path to the event log
+            "log_source": PurePosixPath(logpath).parent.name, # Name of the dataset the log belongs to
+            "logname": PurePosixPath(logpath).name.split('.')[0], # Name of the log without (double) file extension
             "cp_locations": cp_locations, # List of indices of the changepoints in this event log
             "show_progress_bar": not config["meta-parameters"]["DO_SINGLE_BAR"]
         }
         for logpath, cp_locations in logPaths_Changepoints
     ]
 
-    arguments = [
-        (funcname, arg_dict | meta_arg)
-        for funcname, arg_dict in arguments
-        for meta_arg in meta_args
-    ]
-    # Shuffle the Tasks
-    np.random.shuffle(arguments)
-    # Give each task an index for progress bar (only used if DO_SINGLE_BAR is False)
-    arguments = [
-        (funcname, d | {"position": idx})
-        for idx, (funcname, d) in enumerate(arguments)
-    ]
+    # Shuffle the logs, and the tasks of each log. The tasks of a log stay contiguous, so that they can be handed to a single worker whose log cache is hit
+    np.random.shuffle(meta_args)
+    log_tasks = []
+    for meta_arg in meta_args:
+        tasks = [(funcname, {**arg_dict, **meta_arg}) for funcname, arg_dict in arguments]
+        np.random.shuffle(tasks)
+        log_tasks += tasks
+    arguments = log_tasks
+    # Give each task an index for progress bar (only used if DO_SINGLE_BAR is False). Every task has its own dict, so it can be set in place
+    for idx, (_, d) in enumerate(arguments):
+        d["position"] = idx
     return arguments
 
-def write_results_to_buffer(new_rows, existing_df):
-    df_new = pd.DataFrame(new_rows)
-    if df_new.empty:
-        return existing_df
+# Number of buffered result rows at which they are written to the results file
+FLUSH_ROWS = 10_000
 
-    all_columns = sorted(set(existing_df.columns).union(df_new.columns))
+def _csv_value(value):
+    """
+        Formats a result value for the csv writer. NaN is written as an empty field, as pandas does
+    """
+    return '' if isinstance(value, float) and math.isnan(value) else value
 
-    # Align both frames
-    existing_df = existing_df.reindex(columns=all_columns)
-    df_new = df_new.reindex(columns=all_columns)
+def open_results_file(results_file):
+    """Creates (or overwrites) the results file. The file stays open for the writes of the whole run, its header is written with the first rows (see `write_results`).
 
-    # Append
-    updated_df = pd.concat([existing_df, df_new], ignore_index=True)
-    return updated_df
+    Args:
+        results_file (str): The path of the results file.
+
+    Returns:
+        Tuple[TextIO, csv.writer]: The open file, and a csv writer for the result rows. The file has to be closed by the caller.
+    """
+    # Large buffer, so the rows are handed to the OS in few large writes
+    fh = open(results_file, 'w', newline='', buffering=1 << 20)
+    writer = csv.writer(fh, lineterminator='\n')
+    return fh, writer
+
+def write_results(rows, writer, fh, columns):
+    """Writes buffered result rows to the results file and empties the buffer. The first call writes the header.
+
+    Args:
+        rows (List[Dict]): The buffered result rows. Columns that a row does not set are left empty.
+        writer (csv.writer): The csv writer of the results file, see `open_results_file`.
+        fh (TextIO): The open results file. Flushed after writing, so the written rows are not lost if the run is aborted. It is only synced to disk once at the end of the run.
+        columns (List[str]): The columns in the order of the fields in the file. Empty before the first call, which sets the sorted keys of its rows. Keys of later rows that are not a column yet are appended (sorted) in place, see `sort_results_columns`.
+
+    Returns:
+        int: The number of written rows.
+    """
+    num_rows = len(rows)
+    is_first_write = not columns
+    columns.extend(sorted({key for row in rows for key in row}.difference(columns)))
+    if is_first_write:
+        writer.writerow(columns)
+    # Each row is converted to the list of its values in a single pass over the columns
+    writer.writerows([_csv_value(row.get(column, '')) for column in columns] for row in rows)
+    fh.flush()
+    rows.clear()
+    return num_rows
+
+def sort_results_columns(results_file, columns):
+    """Rewrites the results file with all columns in sorted order, if rows written after the first batch added columns. Otherwise the file already has sorted columns and is left as is.
+
+    Args:
+        results_file (str): The path of the results file. Has to be closed.
+        columns (List[str]): The columns in the order of the fields in the file, see `write_results`. Rows written before a column was added have fewer fields, their missing values are written as empty fields.
+    """
+    sorted_columns = sorted(columns)
+    with open(results_file, newline='') as fh:
+        header = next(csv.reader(fh), [])
+    if not columns or header == sorted_columns:
+        return
+    order = [columns.index(column) for column in sorted_columns]
+    tmp_file = f"{results_file}.tmp"
+    with open(results_file, newline='') as src, open(tmp_file, 'w', newline='', buffering=1 << 20) as dst:
+        reader = csv.reader(src)
+        next(reader)
+        writer = csv.writer(dst, lineterminator='\n')
+        writer.writerow(sorted_columns)
+        writer.writerows([row[i] if i < len(row) else '' for i in order] for row in reader)
+        dst.flush()
+        os.fsync(dst.fileno())
+    os.replace(tmp_file, results_file)
+
+def _results_writer(batches, writer, fh, columns, errors):
+    """
+        Writes the batches of result rows from the queue `batches` to the results file until it receives None. An error is appended to `errors`, and later batches are then discarded so the queue does not block
+    """
+    while (rows := batches.get()) is not None:
+        if errors:
+            continue
+        try:
+            write_results(rows, writer, fh, columns)
+        except Exception as e:
+            errors.append(e)
 
 # === Main execution ===
-def main(test_run: bool = False, num_cores: int = None):
+def main(test_run: bool = False, num_cores: int = None, parquet: bool = False, threads: bool = False):
     if num_cores is None:
         num_cores = max(1, os.cpu_count() - 2)
+    # Cores reserved for each worker when pinning them to cores
+    inner_budget = max(1, cpu_count() // num_cores)
 
     logPaths_Changepoints = get_logpaths_with_changepoints()
 
@@ -707,56 +966,90 @@ def main(test_run: bool = False, num_cores: int = None):
     print(arguments)
 
     # Prepare file structure
+    approach_dirs = dict() # Directory of the intermediate results for each test function
     for approach, approach_config in config["approaches"].items():
         if approach_config["enabled"]:
             Path("Reproducibility_Intermediate_Results", approach).mkdir(parents=True, exist_ok=True)
+            approach_dirs[approach_config["function"]] = approach
+    # Intermediate results are buffered per approach and log, and written once all tasks of the log are done
+    intermediate_rows = defaultdict(list)
+    written_files = set()
+    current_logpath = None
 
     # Prepare result file buffer
     results_file = "algorithm_results.csv" # old results file will be overwritten
-    results_df = pd.DataFrame()
-    results_file_columns = []
+    result_rows = [] # Rows not yet written to the results file
+    rows_written = 0
 
     # Start execution
     time_start = default_timer()
     freeze_support()
-    tqdm.set_lock(RLock())
-
-    # write every x iterations
-    write_every_x_iterations = 100
-    counter = 0
-    next_write_index = 0  # To track newly added rows
-
-    with Pool(num_cores, initializer=tqdm.set_lock, initargs=(tqdm.get_lock(),)) as p:
-        if config["meta-parameters"]["DO_SINGLE_BAR"]:
-            for result in tqdm(p.imap(callFunction, arguments), desc="Calculating.. Completed PCD Instances", total=len(arguments)):
-                if result is np.NaN:
-                    continue
-                flattened = [r for r in result]
-                results_df = write_results_to_buffer(flattened, results_df)
-
-                counter += 1
-                if counter % write_every_x_iterations == 0:
-                    new_rows = results_df.iloc[next_write_index:]
-                    if new_rows.empty:
-                        continue
-
-                    if results_file_columns == list(results_df.columns):
-                        # append to the CSV file
-                        new_rows.to_csv(results_file, index=False, mode='a', header=False)
-                    else:
-                        # write new CSV file
-                        results_df.to_csv(results_file, index=False)
-                        results_file_columns = list(results_df.columns)
-                    next_write_index = len(results_df)
-        else:
-            results = p.map(callFunction, arguments)
-            results = [r for r in results if r is not np.NaN]
-            flattened_results = [res for function_return in results for res in function_return]
-            results_df = write_results_to_buffer(flattened_results, results_df)
 
-    # Final write
-    results_df.to_csv(results_file, index=False)
-    tqdm.write(f"[WRITE] Final results written to {results_file} with {len(results_df)} rows.")
+    logpaths = list(dict.fromkeys(arg[1]["filepath"] for arg in arguments))
+    # Hand all tasks of a log to the same worker at once. Chunks hold several whole logs, so that each worker gets about 4 chunks (fewer round trips, while still balancing the load)
+    tasks_per_log = max(1, len(arguments) // max(1, len(logpaths)))
+    chunksize = tasks_per_log * max(1, len(logpaths) // (num_cores * 4))
+    p = get_pool(num_cores, inner_budget, threads=threads)
+    results_fh, results_writer = open_results_file(results_file)
+    # Batches of result rows are written by a separate thread, so collecting results does not wait for the file. At most 2 batches wait to be written
+    results_queue = queue.Queue(maxsize=2)
+    result_columns = []
+    write_errors = []
+    writer_thread = threading.Thread(target=_results_writer, args=(results_queue, results_writer, results_fh, result_columns, write_errors), daemon=True)
+    try:
+        # Results stream back as chunks complete and are written in batches. A chunk holds all tasks of its logs, so the results of a log arrive together and its intermediate results are written once it is done
+        # Chunks are submitted as others complete, with at most 2 per worker in flight, so tasks are not all pickled and queued up front
+        indexed_arguments = list(enumerate(arguments))
+        chunks = (indexed_arguments[i:i+chunksize] for i in range(0, len(indexed_arguments), chunksize))
+        in_flight = {p.submit(callFunctionChunk, chunk) for chunk in islice(chunks, 2 * num_cores)}
+        # The first submission forks all workers of the pool, so the writer thread is only started afterwards (forking while other threads run can deadlock the children)
+        writer_thread.start()
+        with tqdm(desc="Calculating.. Completed PCD Instances", total=len(arguments), disable=not config["meta-parameters"]["DO_SINGLE_BAR"]) as progress:
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                in_flight.update(p.submit(callFunctionChunk, chunk) for chunk in islice(chunks, len(done)))
+                for future in done:
+                    chunk_results = future.result()
+                    progress.update(len(chunk_results))
+                    for idx, result in chunk_results:
+                        if not result:
+                            continue
+                        funcname, task_args = arguments[idx]
+                        if task_args["filepath"] != current_logpath:
+                            flush_intermediate_results(intermediate_rows, written_files, parquet)
+                            current_logpath = task_args["filepath"]
+                        intermediate_rows[(approach_dirs[funcname], task_args["logname"])].extend(result)
+                        result_rows.extend(result)
+
+                    if len(result_rows) >= FLUSH_ROWS:
+                        rows_written += len(result_rows)
+                        results_queue.put(result_rows)
+                        result_rows = []
+        flush_intermediate_results(intermediate_rows, written_files, parquet)
+
+        # Final write of the rows not yet written in a batch. The file is only rewritten if later batches added columns
+        if result_rows:
+            rows_written += len(result_rows)
+            results_queue.put(result_rows)
+        results_queue.put(None)
+        writer_thread.join()
+        if write_errors:
+            raise write_errors[0]
+        os.fsync(results_fh.fileno())
+        # The file is closed before it may be rewritten, as an open file can not be replaced on Windows
+        results_fh.close()
+        sort_results_columns(results_file, result_columns)
+    except BaseException:
+        # The workers may still be busy with tasks of this run, so they must not be reused
+        close_pool(terminate=True)
+        raise
+    finally:
+        if writer_thread.is_alive():
+            results_queue.put(None)
+            writer_thread.join()
+        results_fh.close()
+
+    tqdm.write(f"[WRITE] Final results written to {results_file} with {rows_written} rows.")
 
     elapsed_time = math.floor(default_timer() - time_start)
     elapsed_formatted = datetime.strftime(datetime.utcfromtimestamp(elapsed_time), '%H:%M:%S')
@@ -766,6 +1059,8 @@ def main(test_run: bool = False, num_cores: int = None):
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description="Run drift detection evaluation.")
     parser.add_argument("--test_run", action='store_true', help="If true, only performs evaluation on one log.")
+    parser.add_argument("--parquet", action='store_true', help="If true, intermediate results are written as Parquet instead of CSV files (requires pyarrow).")
+    parser.add_argument("--threads", action='store_true', help="If true, tasks run in threads instead of worker processes. Avoids pickling and copies of the logs per worker, but is only faster for detectors that release the GIL.")
     args = parser.parse_args()
 
-    main(test_run=args.test_run)
\ No newline at end of file
+    main(test_run=args.test_run, parquet=args.parquet, threads=args.threads)
\ No newline at end of file
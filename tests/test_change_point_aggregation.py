@@ -0,0 +1,89 @@
+"""Regression tests for the aggregation of change points across window sizes, against the previous pure-Python implementation."""
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from testAll_reproducibility import aggregate_change_points_by_window, deduplicate_change_points_by_window
+
+
+def _reference_aggregate(cp_all_window_sizes, alpha=1.0):
+    """
+        Previous implementation of `aggregate_change_points_by_window`, returning the merged records as (cp, window_size, support, supporting_windows) tuples
+    """
+    records = [
+        {"cp": cp, "window_size": ws, "support": 1, "supporting_windows": {ws}}
+        for ws, cp_list in cp_all_window_sizes.items()
+        for cp in cp_list
+    ]
+    records.sort(key=lambda x: (-x["window_size"], x["cp"]))
+
+    merged_records = []
+    for i, rec_a in enumerate(records):
+        candidates = []
+        for rec_b in records[i + 1:]:
+            if rec_b["window_size"] >= rec_a["window_size"]:
+                continue
+            dist = abs(rec_a["cp"] - rec_b["cp"])
+            if dist <= rec_a["window_size"] * alpha:
+                candidates.append((dist, rec_b))
+        if candidates:
+            _, closest = min(candidates, key=lambda x: x[0])
+            closest["support"] += rec_a["support"]
+            closest["supporting_windows"] |= rec_a["supporting_windows"]
+        else:
+            merged_records.append(rec_a)
+    return [(r["cp"], r["window_size"], r["support"], r["supporting_windows"]) for r in merged_records]
+
+def _as_tuples(aggregated_df):
+    """
+        Converts the result of `aggregate_change_points_by_window` to the tuples of `_reference_aggregate`
+    """
+    return [
+        (int(r.cp), int(r.window_size), int(r.support), set(map(int, r.supporting_windows)))
+        for r in aggregated_df.itertuples()
+    ]
+
+def _random_cases(num_cases=200, seed=0):
+    """
+        Fixed pseudo-random inputs: up to 6 window sizes with up to 8 change points each, dense and sparse, sorted and unsorted
+    """
+    rng = random.Random(seed)
+    cases = []
+    for _ in range(num_cases):
+        case = dict()
+        for ws in rng.sample([100, 200, 300, 400, 500, 600], rng.randint(1, 6)):
+            cps = sorted(rng.sample(range(0, 3000, rng.choice([1, 7, 50])), rng.randint(0, 8)))
+            case[ws] = cps if rng.random() < 0.7 else cps[::-1]
+        cases.append(case)
+    return cases
+
+CASES = [
+    {100: [500]},
+    {100: [], 200: []},
+    {200: [1000], 100: [1000]},
+    {300: [1000], 200: [1100, 900], 100: [1050]}, # Equally distant candidates
+    {600: [10, 2990], 500: [20, 2980], 400: [30], 300: [], 200: [40, 2970], 100: [2960]},
+] + _random_cases()
+
+
+@pytest.mark.parametrize("alpha", [0.3, 0.5, 0.7, 1.0])
+@pytest.mark.parametrize("cp_all_window_sizes", CASES)
+def test_aggregate_matches_reference(cp_all_window_sizes, alpha):
+    assert _as_tuples(aggregate_change_points_by_window(cp_all_window_sizes, alpha)) == _reference_aggregate(cp_all_window_sizes, alpha)
+
+@pytest.mark.parametrize("min_support_windows", [1, 2, 3])
+@pytest.mark.parametrize("cp_all_window_sizes", CASES)
+def test_deduplicate_matches_reference(cp_all_window_sizes, min_support_windows):
+    expected = [cp for cp, _, support, _ in _reference_aggregate(cp_all_window_sizes, 0.5) if support >= min_support_windows]
+    assert [int(cp) for cp in deduplicate_change_points_by_window(cp_all_window_sizes, 0.5, min_support_windows)] == expected
+
+def test_aggregate_empty():
+    assert aggregate_change_points_by_window({}).empty
+    assert deduplicate_change_points_by_window({}) == []
+
+def test_aggregate_too_many_window_sizes():
+    with pytest.raises(ValueError):
+        aggregate_change_points_by_window({ws: [ws] for ws in range(1, 66)})
@@ -0,0 +1,32 @@
+"""Tests that `evaluation.calcF1_AvgLag` agrees with `evaluation.F1_Score` and `evaluation.get_avg_lag`."""
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from cdrift import evaluation
+
+
+CASES = [
+    ([], []),
+    ([], [1000, 2000]),
+    ([1000, 2000], []),
+    ([5000], [1000, 2000]), # No true positives
+    ([1000, 2000], [1000, 2000]),
+    ([1000, 1001, 2000], [1000, 2000]), # Duplicate detection
+    ([1050, 934, 2100], [1000, 1149, 2000]),
+    ([150, 390, 1200, 1399, 2300, 2410, 3600], [1199, 2399, 3599, 4799]),
+]
+
+
+def _same(a, b):
+    return (math.isnan(a) and math.isnan(b)) or a == pytest.approx(b)
+
+@pytest.mark.parametrize("lag", [100, 200])
+@pytest.mark.parametrize("detected,known", CASES)
+def test_calcF1_AvgLag_matches_separate_metrics(detected, known, lag):
+    f1, avg_lag = evaluation.calcF1_AvgLag(detected, known, lag)
+    assert _same(f1, evaluation.F1_Score(detected, known, lag))
+    assert _same(avg_lag, evaluation.get_avg_lag(detected, known, lag))